@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Wrapper script for MCP server with enhanced logging for Claude Code debugging.
+
+Set MCP_WRAPPER_DEBUG=1 to enable the wrapper's debug output on stderr.
 """
 
 import importlib
@@ -10,10 +12,15 @@ import traceback
 from datetime import datetime, timezone
 from pathlib import Path
 
+_DEBUG = os.environ.get("MCP_WRAPPER_DEBUG") == "1"
+_now = datetime.now
+
 
 def log_debug(message):
     """Log debug information to stderr for Claude Code to capture."""
-    timestamp = datetime.now(timezone.utc).isoformat()
+    if not _DEBUG:
+        return
+    timestamp = _now(timezone.utc).isoformat(timespec="seconds")
     print(f"[{timestamp}] WRAPPER DEBUG: {message}", file=sys.stderr, flush=True)
 
 
@@ -41,20 +48,7 @@ def main():
             sys.path.insert(0, str(src_dir))
             log_debug(f"Added src directory to path: {src_dir}")
 
-        # Verify the src directory exists
-        if not src_dir.exists():
-            log_debug(f"ERROR: src directory does not exist: {src_dir}")
-            sys.exit(1)
-
-        # Verify the MCP server module exists
-        mcp_server_path = src_dir / "macos_ui_automation" / "mcp_server.py"
-        if not mcp_server_path.exists():
-            log_debug(f"ERROR: MCP server module does not exist: {mcp_server_path}")
-            sys.exit(1)
-
-        log_debug(f"MCP server module found: {mcp_server_path}")
-
-        # Import and run the server
+        # Import and run the server; a missing src tree surfaces as ImportError
         log_debug("Importing MCP server...")
         mcp_module = importlib.import_module(
             "macos_ui_automation.interfaces.mcp_server"
@@ -66,6 +60,9 @@ def main():
 
     except ImportError as e:
         log_debug(f"Import error: {e}")
+        log_debug(
+            f"Expected the package under: {Path(__file__).parent.resolve() / 'src'}"
+        )
         log_debug(f"Current sys.path: {sys.path}")
         traceback.print_exc(file=sys.stderr)
         sys.exit(1)
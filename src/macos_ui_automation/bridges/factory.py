@@ -8,11 +8,14 @@ implementation based on the environment and testing requirements.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING
 
 # Import moved inside function to avoid circular imports
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .fake_bridge import FakeAXUIElement, FakeNSRunningApplication
     from .interfaces import ApplicationBridge, PyObjCBridge, WorkspaceBridge
 
@@ -39,12 +42,34 @@ except ImportError:
     RealPyObjCBridge = None
     RealWorkspaceBridge = None
 
+# Availability never changes after import, so check it once here
+_FAKE_BRIDGES_AVAILABLE = all(
+    [FakePyObjCBridge, FakeWorkspaceBridge, FakeApplicationBridge]
+)
+_REAL_BRIDGES_AVAILABLE = all(
+    [RealPyObjCBridge, RealWorkspaceBridge, RealApplicationBridge]
+)
+
 logger = logging.getLogger(__name__)
 
-# Global bridge instances
-_pyobjc_bridge: PyObjCBridge | None = None
-_workspace_bridge: WorkspaceBridge | None = None
-_application_bridge: ApplicationBridge | None = None
+# Global bridge instances, stored together so getters need a single check
+_bridges: tuple[PyObjCBridge, WorkspaceBridge, ApplicationBridge] | None = None
+# Guards lazy creation so concurrent first calls build the bridges only once
+_bridge_lock = threading.Lock()
+
+# Resolved lazily on first use; registry import is deferred to avoid a cycle
+_is_test_mode: Callable[[], bool] | None = None
+
+
+def _create_default_fake_bridges() -> tuple[
+    PyObjCBridge, WorkspaceBridge, ApplicationBridge
+]:
+    """Create fresh fake bridges populated with the default test data."""
+    return (
+        FakePyObjCBridge(),
+        FakeWorkspaceBridge(),
+        FakeApplicationBridge(),
+    )
 
 
 def create_fake_bridges_with_system(
@@ -61,7 +86,7 @@ def create_fake_bridges_with_system(
     Returns:
         Tuple of (FakePyObjCBridge, FakeWorkspaceBridge, FakeApplicationBridge)
     """
-    if not all([FakePyObjCBridge, FakeWorkspaceBridge, FakeApplicationBridge]):
+    if not _FAKE_BRIDGES_AVAILABLE:
         msg = "Fake bridge classes not available"
         raise ImportError(msg)
 
@@ -85,34 +110,31 @@ def create_pyobjc_bridge(
     Returns:
         Tuple of (PyObjCBridge, WorkspaceBridge, ApplicationBridge)
     """
+    global _is_test_mode
+
     # Use explicit force_fake parameter or check if we're in test mode
-    # Import here to avoid circular imports
-    from macos_ui_automation.core.registry import is_test_mode
+    # Import here to avoid circular imports, then keep the resolved function
+    if _is_test_mode is None:
+        from macos_ui_automation.core.registry import is_test_mode
 
-    use_fake = force_fake or is_test_mode()
+        _is_test_mode = is_test_mode
+
+    use_fake = force_fake or _is_test_mode()
 
     # If in test mode and bridges are already set globally, use those
-    if (
-        use_fake
-        and _pyobjc_bridge is not None
-        and _workspace_bridge is not None
-        and _application_bridge is not None
-    ):
-        return _pyobjc_bridge, _workspace_bridge, _application_bridge
+    bridges = _bridges
+    if use_fake and bridges is not None:
+        return bridges
 
     if use_fake:
         logger.info("Using fake PyObjC bridge for testing")
-        if not all([FakePyObjCBridge, FakeWorkspaceBridge, FakeApplicationBridge]):
+        if not _FAKE_BRIDGES_AVAILABLE:
             msg = "Fake bridge classes not available"
             raise ImportError(msg)
 
-        return (
-            FakePyObjCBridge(),
-            FakeWorkspaceBridge(),
-            FakeApplicationBridge(),
-        )
+        return _create_default_fake_bridges()
 
-    if all([RealPyObjCBridge, RealWorkspaceBridge, RealApplicationBridge]):
+    if _REAL_BRIDGES_AVAILABLE:
         logger.info("Using real PyObjC bridge")
         return (
             RealPyObjCBridge(),
@@ -122,15 +144,30 @@ def create_pyobjc_bridge(
 
     logger.warning("Real PyObjC bridge not available, falling back to fake")
     logger.info("Falling back to fake PyObjC bridge")
-    if not all([FakePyObjCBridge, FakeWorkspaceBridge, FakeApplicationBridge]):
+    if not _FAKE_BRIDGES_AVAILABLE:
         msg = "Neither real nor fake bridge classes are available"
         raise ImportError(msg)
 
-    return (
-        FakePyObjCBridge(),
-        FakeWorkspaceBridge(),
-        FakeApplicationBridge(),
-    )
+    return _create_default_fake_bridges()
+
+
+def _get_bridges() -> tuple[PyObjCBridge, WorkspaceBridge, ApplicationBridge]:
+    """
+    Get the current bridge instances, creating them on first use.
+
+    Returns:
+        Tuple of (PyObjCBridge, WorkspaceBridge, ApplicationBridge)
+    """
+    global _bridges
+
+    bridges = _bridges
+    if bridges is None:
+        with _bridge_lock:
+            bridges = _bridges
+            if bridges is None:
+                bridges = _bridges = create_pyobjc_bridge()
+
+    return bridges
 
 
 def get_pyobjc_bridge() -> PyObjCBridge:
@@ -140,16 +177,7 @@ def get_pyobjc_bridge() -> PyObjCBridge:
     Returns:
         PyObjCBridge implementation
     """
-    global _pyobjc_bridge, _workspace_bridge, _application_bridge
-
-    if (
-        _pyobjc_bridge is None
-        or _workspace_bridge is None
-        or _application_bridge is None
-    ):
-        _pyobjc_bridge, _workspace_bridge, _application_bridge = create_pyobjc_bridge()
-
-    return _pyobjc_bridge
+    return _get_bridges()[0]
 
 
 def get_workspace_bridge() -> WorkspaceBridge:
@@ -159,16 +187,7 @@ def get_workspace_bridge() -> WorkspaceBridge:
     Returns:
         WorkspaceBridge implementation
     """
-    global _pyobjc_bridge, _workspace_bridge, _application_bridge
-
-    if (
-        _pyobjc_bridge is None
-        or _workspace_bridge is None
-        or _application_bridge is None
-    ):
-        _pyobjc_bridge, _workspace_bridge, _application_bridge = create_pyobjc_bridge()
-
-    return _workspace_bridge
+    return _get_bridges()[1]
 
 
 def get_application_bridge() -> ApplicationBridge:
@@ -178,16 +197,7 @@ def get_application_bridge() -> ApplicationBridge:
     Returns:
         ApplicationBridge implementation
     """
-    global _pyobjc_bridge, _workspace_bridge, _application_bridge
-
-    if (
-        _pyobjc_bridge is None
-        or _workspace_bridge is None
-        or _application_bridge is None
-    ):
-        _pyobjc_bridge, _workspace_bridge, _application_bridge = create_pyobjc_bridge()
-
-    return _application_bridge
+    return _get_bridges()[2]
 
 
 def reset_bridges() -> None:
@@ -196,10 +206,8 @@ def reset_bridges() -> None:
 
     Useful for testing when you want to switch between real and fake implementations.
     """
-    global _pyobjc_bridge, _workspace_bridge, _application_bridge
-    _pyobjc_bridge = None
-    _workspace_bridge = None
-    _application_bridge = None
+    global _bridges
+    _bridges = None
 
 
 def set_bridge_instances(
@@ -217,7 +225,5 @@ def set_bridge_instances(
         workspace_bridge: Workspace bridge implementation
         application_bridge: Application bridge implementation
     """
-    global _pyobjc_bridge, _workspace_bridge, _application_bridge
-    _pyobjc_bridge = pyobjc_bridge
-    _workspace_bridge = workspace_bridge
-    _application_bridge = application_bridge
+    global _bridges
+    _bridges = (pyobjc_bridge, workspace_bridge, application_bridge)
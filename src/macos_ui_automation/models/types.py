@@ -47,6 +47,8 @@ class UIAction(str, Enum):
 class Position(BaseModel):
     """2D position coordinates."""
 
+    model_config = ConfigDict(frozen=True)  # Immutable and hashable
+
     x: int = Field(description="X coordinate")
     y: int = Field(description="Y coordinate")
 
@@ -62,6 +64,8 @@ class Position(BaseModel):
 class Size(BaseModel):
     """2D size dimensions."""
 
+    model_config = ConfigDict(frozen=True)  # Immutable and hashable
+
     width: int = Field(description="Width in pixels")
     height: int = Field(description="Height in pixels")
 
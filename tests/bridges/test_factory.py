@@ -4,8 +4,13 @@ Unit tests for bridges/factory.py.
 Tests the bridge factory functions for dependency injection.
 """
 
+import threading
+import time
+from unittest.mock import patch
+
 import pytest
 
+from macos_ui_automation.bridges import factory
 from macos_ui_automation.bridges.factory import (
     create_pyobjc_bridge,
     get_application_bridge,
@@ -107,6 +112,33 @@ class TestBridgeFactory:
         # Should be different instances
         assert bridge1 is not bridge2
 
+    def test_concurrent_getters_create_bridges_once(self):
+        """Test that concurrent first calls construct the bridges only once."""
+        reset_bridges()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_pyobjc_bridge())
+
+        def slow_create():
+            # Hold the creation open so the other threads reach the getter
+            time.sleep(0.05)
+            return create_pyobjc_bridge()
+
+        with patch.object(
+            factory, "create_pyobjc_bridge", side_effect=slow_create
+        ) as mock_create:
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_create.call_count == 1
+        assert all(bridge is results[0] for bridge in results)
+
     def test_set_bridge_instances(self):
         """Test setting custom bridge instances."""
         # Create custom fake bridges
@@ -78,6 +78,15 @@ class TestPosition:
         assert pos.x == FLOAT_X_RESULT
         assert pos.y == FLOAT_Y_RESULT
 
+    def test_position_is_frozen(self):
+        """Test that positions are immutable and hashable."""
+        pos = Position(x=SMALL_X, y=SMALL_Y)
+        with pytest.raises(ValidationError):
+            pos.x = SAMPLE_X
+
+        assert hash(pos) == hash(Position(x=SMALL_X, y=SMALL_Y))
+        assert {pos: "cached"}[Position(x=SMALL_X, y=SMALL_Y)] == "cached"
+
 
 class TestSize:
     """Test Size model."""
@@ -107,6 +116,14 @@ class TestSize:
         assert size.width == LARGE_DIMENSION
         assert size.height == LARGE_DIMENSION
 
+    def test_size_is_frozen(self):
+        """Test that sizes are immutable and hashable."""
+        size = Size(width=SMALL_WIDTH, height=SMALL_HEIGHT)
+        with pytest.raises(ValidationError):
+            size.width = STANDARD_WIDTH
+
+        assert hash(size) == hash(Size(width=SMALL_WIDTH, height=SMALL_HEIGHT))
+
 
 class TestUIElement:
     """Test UIElement model."""